@@ -0,0 +1,221 @@
+import gzip
+import hashlib
+import logging
+import mimetypes
+import os
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+import brotli
+from fastapi import Request, Response
+
+logger = logging.getLogger(__name__)
+
+# CRA emits content-hashed names such as main.3f9c2a1b.js, 453.8ab1c2d3.chunk.css
+# or main.3f9c2a1b.js.LICENSE.txt
+HASHED_ASSET_RE = re.compile(r"\.[0-9a-f]{8,}\.(?:chunk\.)?[a-z0-9]+(?:\.map|\.LICENSE\.txt)?$")
+# Only the build's static/ folder holds hashed output; top-level public files are copied verbatim
+HASHED_ASSET_PREFIX = "static/"
+# Source maps are left out: only devtools request them and they dominate startup time
+COMPRESSIBLE_EXTENSIONS = {".html", ".js", ".css", ".json", ".svg", ".txt", ".xml", ".ico"}
+MIN_COMPRESS_SIZE = 512
+# Quality 11 takes seconds per MB; prebuilt .br siblings can still use it
+BROTLI_RUNTIME_QUALITY = 5
+
+# Server preference used to break q-value ties, best first
+ENCODING_PREFERENCE = ("br", "gzip", "identity")
+
+IMMUTABLE_CACHE = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE = "no-cache"
+
+RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+@dataclass
+class StaticAsset:
+    content_type: str
+    cache_control: str
+    # Keyed by content-coding ("identity", "gzip", "br") -> (body, strong ETag)
+    variants: Dict[str, tuple] = field(default_factory=dict)
+
+
+def _etag(body: bytes) -> str:
+    return '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+
+
+def _accepted_encodings(header: str) -> Dict[str, float]:
+    """Parses an Accept-Encoding header into a coding -> q-value mapping."""
+    accepted = {}
+    for part in header.split(","):
+        coding, _, params = part.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        match = re.search(r"q=([0-9.]+)", params)
+        if match:
+            try:
+                q = float(match.group(1))
+            except ValueError:
+                q = 0.0
+        accepted[coding] = q
+    return accepted
+
+
+def _select_encoding(header: str, available: List[str]) -> str:
+    """
+    Picks the variant to send: highest q-value wins, ties go to the server
+    preference (br > gzip > identity). '*' matches any coding not listed.
+    """
+    accepted = _accepted_encodings(header)
+    wildcard = accepted.get("*")
+    best, best_q = "identity", -1.0
+    for coding in ENCODING_PREFERENCE:
+        if coding not in available:
+            continue
+        q = accepted.get(coding, wildcard)
+        if q is None:
+            # identity is acceptable unless explicitly refused
+            q = 0.001 if coding == "identity" else 0.0
+        if q > best_q and q > 0:
+            best, best_q = coding, q
+    return best
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    if if_none_match.strip() == "*":
+        return True
+    # If-None-Match uses weak comparison, so a W/ prefix is ignored
+    candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return etag in candidates
+
+
+def _parse_range(header: str, size: int) -> Optional[tuple]:
+    """
+    Returns (start, end) inclusive for a single satisfiable byte range,
+    None if the header should be ignored, or () if it is unsatisfiable.
+    """
+    match = RANGE_RE.match(header.strip())
+    if not match:
+        # Multiple or malformed ranges: fall back to the full body
+        return None
+    first, last = match.groups()
+    if not first and not last:
+        return None
+    if not first:
+        length = int(last)
+        if length == 0:
+            return ()
+        return (max(size - length, 0), size - 1)
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if start >= size or start > end:
+        return ()
+    return (start, end)
+
+
+class StaticAssetIndex:
+    """
+    Indexes a frontend build directory once at startup and serves every file
+    from memory, together with gzip/brotli variants and strong ETags.
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+        self.assets: Dict[str, StaticAsset] = {}
+        if os.path.isdir(root):
+            self._build()
+        else:
+            logger.warning(f"Static directory '{root}' does not exist; no assets indexed.")
+
+    def _build(self):
+        for dirpath, _, filenames in os.walk(self.root):
+            for filename in filenames:
+                # Precompressed siblings are attached to their source file below
+                if filename.endswith((".gz", ".br")):
+                    continue
+                full_path = os.path.join(dirpath, filename)
+                rel_path = os.path.relpath(full_path, self.root).replace(os.sep, "/")
+                self.assets[rel_path] = self._load(full_path, rel_path)
+        logger.info(f"Indexed {len(self.assets)} static assets from '{self.root}'.")
+
+    def _load(self, full_path: str, rel_path: str) -> StaticAsset:
+        with open(full_path, "rb") as f:
+            body = f.read()
+
+        filename = os.path.basename(rel_path)
+        content_type = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+        if content_type.startswith("text/") or content_type in ("application/javascript", "application/json"):
+            content_type += "; charset=utf-8"
+        hashed = rel_path.startswith(HASHED_ASSET_PREFIX) and HASHED_ASSET_RE.search(filename)
+        cache_control = IMMUTABLE_CACHE if hashed else REVALIDATE_CACHE
+
+        asset = StaticAsset(content_type=content_type, cache_control=cache_control)
+        asset.variants["identity"] = (body, _etag(body))
+
+        compressible = os.path.splitext(filename)[1].lower() in COMPRESSIBLE_EXTENSIONS
+        if not compressible or len(body) < MIN_COMPRESS_SIZE:
+            return asset
+
+        source_mtime = os.path.getmtime(full_path)
+        for coding, suffix, compress in (
+            ("br", ".br", lambda data: brotli.compress(data, quality=BROTLI_RUNTIME_QUALITY)),
+            ("gzip", ".gz", lambda data: gzip.compress(data, compresslevel=9, mtime=0)),
+        ):
+            sibling = full_path + suffix
+            # A sibling older than its source is left over from a previous build
+            if os.path.exists(sibling) and os.path.getmtime(sibling) >= source_mtime:
+                with open(sibling, "rb") as f:
+                    compressed = f.read()
+            else:
+                compressed = compress(body)
+            # Only keep variants that actually save bytes
+            if len(compressed) < len(body):
+                asset.variants[coding] = (compressed, _etag(compressed))
+        return asset
+
+    def get(self, path: str) -> Optional[StaticAsset]:
+        return self.assets.get(path.lstrip("/"))
+
+    def response(self, request: Request, asset: StaticAsset) -> Response:
+        """
+        Builds a response for the best variant the client accepts, a 304 for
+        a matching If-None-Match, or a 206 for a single byte range. HEAD
+        requests get the same headers without a body.
+        """
+        coding = _select_encoding(request.headers.get("accept-encoding", ""), list(asset.variants))
+        body, etag = asset.variants[coding]
+
+        headers = {"ETag": etag, "Cache-Control": asset.cache_control, "Accept-Ranges": "bytes"}
+        if len(asset.variants) > 1:
+            headers["Vary"] = "Accept-Encoding"
+
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and _etag_matches(if_none_match, etag):
+            return Response(status_code=304, headers=headers)
+
+        status_code = 200
+        range_header = request.headers.get("range")
+        identity_body, identity_etag = asset.variants["identity"]
+        if_range = request.headers.get("if-range")
+        if range_header and (not if_range or if_range.strip() == identity_etag):
+            byte_range = _parse_range(range_header, len(identity_body))
+            if byte_range == ():
+                headers["Content-Range"] = f"bytes */{len(identity_body)}"
+                return Response(status_code=416, headers=headers)
+            if byte_range is not None:
+                # Ranges always address the unencoded representation
+                coding, etag = "identity", identity_etag
+                start, end = byte_range
+                body = identity_body[start:end + 1]
+                headers["ETag"] = etag
+                headers["Content-Range"] = f"bytes {start}-{end}/{len(identity_body)}"
+                status_code = 206
+
+        if coding != "identity":
+            headers["Content-Encoding"] = coding
+        if request.method == "HEAD":
+            headers["Content-Length"] = str(len(body))
+            return Response(status_code=status_code, media_type=asset.content_type, headers=headers)
+        return Response(content=body, status_code=status_code, media_type=asset.content_type, headers=headers)
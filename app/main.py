@@ -1,7 +1,6 @@
-from fastapi import FastAPI, Request
-from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi import FastAPI, Request, HTTPException
 from app.api import analytics
+from app.core.static_assets import StaticAssetIndex
 import uvicorn
 import os
 
@@ -17,17 +16,27 @@ app.include_router(analytics.router, prefix="/api")
 # Serve the React Frontend
 STATIC_DIR = "frontend/build"
 
-# Mount the static files directory for CSS, JS, etc.
-app.mount("/static", StaticFiles(directory=os.path.join(STATIC_DIR, "static")), name="static")
+# The build folder is indexed once at startup and served from memory.
+# This is a fallback for development environments where the build folder might not exist yet
+FRONTEND_ASSETS = StaticAssetIndex(STATIC_DIR if os.path.isdir(STATIC_DIR) else "frontend/public")
 
-@app.get("/{catchall:path}", response_class=FileResponse)
+@app.api_route("/static/{asset_path:path}", methods=["GET", "HEAD"])
+async def serve_static_asset(request: Request, asset_path: str):
+    """Serves hashed CSS, JS and media files produced by the React build."""
+    asset = FRONTEND_ASSETS.get(f"static/{asset_path}")
+    if asset is None:
+        raise HTTPException(status_code=404, detail="Not Found")
+    return FRONTEND_ASSETS.response(request, asset)
+
+@app.api_route("/{catchall:path}", methods=["GET", "HEAD"])
 async def serve_react_app(request: Request, catchall: str):
-    """Serves the main index.html file for any route not handled by the API."""
-    filepath = os.path.join(STATIC_DIR, "index.html")
-    if not os.path.exists(filepath):
-        # This is a fallback for development environments where the build folder might not exist yet
-        return FileResponse("frontend/public/index.html")
-    return FileResponse(filepath)
+    """Serves top-level build files (favicon, manifest, ...) or index.html for any route not handled by the API."""
+    asset = FRONTEND_ASSETS.get(catchall) if catchall else None
+    if asset is None:
+        asset = FRONTEND_ASSETS.get("index.html")
+    if asset is None:
+        raise HTTPException(status_code=404, detail="Frontend index.html not found.")
+    return FRONTEND_ASSETS.response(request, asset)
 
 if __name__ == "__main__":
     uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
@@ -0,0 +1,144 @@
+import os
+
+import pytest
+from fastapi import Request
+
+from app.core.static_assets import (
+    IMMUTABLE_CACHE,
+    REVALIDATE_CACHE,
+    StaticAssetIndex,
+    _etag_matches,
+    _select_encoding,
+)
+
+BROWSER_ACCEPT_ENCODING = "gzip, deflate, br, zstd"
+HASHED_JS = "static/js/main.3f9c2a1b.js"
+HASHED_LICENSE = "static/js/main.3f9c2a1b.js.LICENSE.txt"
+
+
+def make_request(method: str = "GET", **headers) -> Request:
+    raw_headers = [(name.replace("_", "-").encode(), value.encode()) for name, value in headers.items()]
+    return Request({"type": "http", "method": method, "path": "/", "headers": raw_headers})
+
+
+@pytest.fixture
+def build_dir(tmp_path):
+    files = {
+        "index.html": "<html>" + "x" * 2000 + "</html>",
+        HASHED_JS: "var a=1;" * 500,
+        HASHED_LICENSE: "/*! MIT */",
+        "static/media/logo.png": "p" * 2000,
+        "data.12345678.json": '{"a": 1}' * 200,
+    }
+    for rel_path, content in files.items():
+        path = tmp_path / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+    return tmp_path
+
+
+@pytest.fixture
+def index(build_dir):
+    return StaticAssetIndex(str(build_dir))
+
+
+def test_select_encoding_prefers_brotli_on_ties():
+    assert _select_encoding(BROWSER_ACCEPT_ENCODING, ["identity", "gzip", "br"]) == "br"
+    assert _select_encoding("br;q=0.5, gzip", ["identity", "gzip", "br"]) == "gzip"
+    assert _select_encoding("*", ["identity", "gzip", "br"]) == "br"
+    assert _select_encoding("", ["identity", "gzip", "br"]) == "identity"
+    assert _select_encoding("br;q=0", ["identity", "gzip", "br"]) == "identity"
+
+
+def test_etag_matches_weak_and_wildcard():
+    assert _etag_matches('W/"abc"', '"abc"')
+    assert _etag_matches('"x", "abc"', '"abc"')
+    assert _etag_matches("*", '"abc"')
+    assert not _etag_matches('"x"', '"abc"')
+
+
+def test_browser_gets_brotli_variant(index):
+    response = index.response(make_request(accept_encoding=BROWSER_ACCEPT_ENCODING), index.get(HASHED_JS))
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "br"
+    assert response.headers["vary"] == "Accept-Encoding"
+
+
+def test_conditional_request_returns_304(index):
+    asset = index.get(HASHED_JS)
+    first = index.response(make_request(accept_encoding="gzip"), asset)
+    assert first.headers["content-encoding"] == "gzip"
+
+    second = index.response(make_request(accept_encoding="gzip", if_none_match=first.headers["etag"]), asset)
+    assert second.status_code == 304
+    assert second.body == b""
+    assert second.headers["etag"] == first.headers["etag"]
+    assert second.headers["cache-control"] == IMMUTABLE_CACHE
+
+
+def test_cache_policy_only_immutable_for_hashed_static_files(index):
+    assert index.get(HASHED_JS).cache_control == IMMUTABLE_CACHE
+    assert index.get(HASHED_LICENSE).cache_control == IMMUTABLE_CACHE
+    assert index.get("index.html").cache_control == REVALIDATE_CACHE
+    assert index.get("static/media/logo.png").cache_control == REVALIDATE_CACHE
+    assert index.get("data.12345678.json").cache_control == REVALIDATE_CACHE
+
+
+def test_small_or_binary_files_have_no_encoded_variants(index):
+    response = index.response(make_request(accept_encoding=BROWSER_ACCEPT_ENCODING), index.get("static/media/logo.png"))
+    assert "content-encoding" not in response.headers
+    assert "vary" not in response.headers
+
+
+def test_stale_precompressed_sibling_is_ignored(build_dir):
+    source = build_dir / "index.html"
+    stale = build_dir / "index.html.br"
+    stale.write_bytes(b"stale")
+    os.utime(stale, (0, 0))
+
+    index = StaticAssetIndex(str(build_dir))
+    body, _ = index.get("index.html").variants["br"]
+    assert body != b"stale"
+
+    os.utime(stale, (source.stat().st_mtime + 10,) * 2)
+    index = StaticAssetIndex(str(build_dir))
+    assert index.get("index.html").variants["br"][0] == b"stale"
+
+
+def test_head_returns_headers_without_body(index):
+    asset = index.get(HASHED_JS)
+    get = index.response(make_request(accept_encoding="gzip"), asset)
+    head = index.response(make_request("HEAD", accept_encoding="gzip"), asset)
+    assert head.status_code == 200
+    assert head.body == b""
+    assert head.headers["content-length"] == str(len(get.body))
+    assert head.headers["etag"] == get.headers["etag"]
+
+
+def test_range_request_returns_partial_identity_body(index):
+    asset = index.get("static/media/logo.png")
+    response = index.response(make_request(range="bytes=10-19"), asset)
+    assert response.status_code == 206
+    assert response.body == b"p" * 10
+    assert response.headers["content-range"] == "bytes 10-19/2000"
+
+    unsatisfiable = index.response(make_request(range="bytes=5000-"), asset)
+    assert unsatisfiable.status_code == 416
+
+
+def test_mismatched_if_range_returns_full_body(index):
+    asset = index.get("static/media/logo.png")
+    response = index.response(make_request(range="bytes=10-19", if_range='"outdated"'), asset)
+    assert response.status_code == 200
+    assert response.body == b"p" * 2000
+    assert "content-range" not in response.headers
+
+
+def test_range_request_ignores_preferred_encoding(index):
+    asset = index.get(HASHED_JS)
+    identity_body, identity_etag = asset.variants["identity"]
+    response = index.response(make_request(accept_encoding="br", range="bytes=0-7"), asset)
+    assert response.status_code == 206
+    assert response.body == identity_body[:8]
+    assert "content-encoding" not in response.headers
+    assert response.headers["etag"] == identity_etag